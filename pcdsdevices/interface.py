@@ -1,6 +1,7 @@
 """
 Module for defining bell-and-whistles movement features.
 """
+import copy
 import functools
 import logging
 import numbers
@@ -9,8 +10,11 @@ import re
 import shutil
 import signal
 import subprocess
+import sys
 import time
 import typing
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from threading import Event
@@ -18,9 +22,8 @@ from types import MethodType, SimpleNamespace
 from typing import Optional
 from weakref import WeakSet
 
+import numpy as np
 import ophyd
-import yaml
-from bluesky.utils import ProgressBar
 from lightpath import LightpathState
 from ophyd import Component as Cpt
 from ophyd.device import Device
@@ -36,6 +39,26 @@ try:
 except ImportError:
     fcntl = None
 
+
+@functools.lru_cache(maxsize=1)
+def _yaml_tools():
+    """
+    Import yaml on first use.
+
+    Sessions that never touch presets should not pay the import cost at
+    module load time.
+    """
+    import yaml
+    try:
+        # LibYAML's C implementation parses and dumps several times faster
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+    return yaml, Loader, Dumper
+
+
 try:
     from elog.utils import get_primary_elog
     has_elog = True
@@ -53,6 +76,59 @@ Positioner_whitelist = ["settle_time", "timeout", "egu", "limits", "move",
                         "position", "moving", "set_current_position"]
 Interface_whitelist = ["screen", "post_elog_status"]
 
+# Every live TabCompletionHelperClass, so cached dir listings can be flushed
+_tab_class_helpers = WeakSet()
+
+# Detects whitelist entries that are regex patterns rather than plain names
+_REGEX_META_RE = re.compile(r'[.*+?\[\](){}|\\^$]')
+
+
+def _trie_to_pattern(node):
+    """Emit the regex pattern for one node of a literal-name trie."""
+    alternatives = []
+    optional = False
+    for char, child in sorted(node.items(), key=lambda item: item[0] or ''):
+        if char is None:
+            # A whitelisted name ends at this node
+            optional = True
+        else:
+            alternatives.append(re.escape(char) + _trie_to_pattern(child))
+    if not alternatives:
+        return ''
+    if len(alternatives) == 1 and not optional:
+        return alternatives[0]
+    pattern = '(?:' + '|'.join(alternatives) + ')'
+    if optional:
+        pattern += '?'
+    return pattern
+
+
+def _build_trie_regex(strings):
+    """
+    Compile an alternation over ``strings``, factoring common prefixes.
+
+    Literal names are merged into a trie-style pattern (``mv|mvr|mv_ginput``
+    becomes ``mv(?:r|_ginput)?``), so the regex engine discriminates on the
+    leading characters instead of scanning every alternative left to right.
+    Entries that contain regex metacharacters are kept as-is.
+    """
+    branches = []
+    literals = []
+    for entry in sorted(set(strings)):
+        if _REGEX_META_RE.search(entry):
+            branches.append(entry)
+        else:
+            literals.append(entry)
+    if literals:
+        trie = {}
+        for literal in literals:
+            tree_node = trie
+            for char in literal:
+                tree_node = tree_node.setdefault(char, {})
+            tree_node[None] = {}
+        branches.append(_trie_to_pattern(trie))
+    return re.compile('|'.join(branches))
+
 
 class _TabCompletionHelper:
     """
@@ -61,6 +137,8 @@ class _TabCompletionHelper:
 
     _includes: set[str]
     _regex: typing.Optional[typing.Pattern]
+    _literals: typing.Optional[frozenset[str]]
+    _pattern_regex: typing.Optional[typing.Pattern]
 
     def __init__(self):
         self._includes = set()
@@ -69,23 +147,50 @@ class _TabCompletionHelper:
 
     def build_regex(self) -> typing.Pattern:
         """Update the regular expression based on the current includes."""
-        self._regex = re.compile("|".join(sorted(self._includes)))
+        self._regex = _build_trie_regex(self._includes)
         return self._regex
 
+    def build_filters(self):
+        """
+        Partition the includes into literal names and regex patterns.
+
+        Most whitelist entries are plain attribute names, so filtering can
+        be a fast set membership check, with a single compiled alternation
+        reserved for the few true patterns (e.g. ``mv_.*``).
+        """
+        literals = set()
+        patterns = set()
+        for include in self._includes:
+            if _REGEX_META_RE.search(include):
+                patterns.add(include)
+            else:
+                literals.add(include)
+        self._literals = frozenset(literals)
+        if patterns:
+            self._pattern_regex = re.compile("|".join(sorted(patterns)))
+        else:
+            self._pattern_regex = None
+
+    def _invalidate(self):
+        """Invalidate anything derived from the current includes."""
+        self._regex = None
+        self._literals = None
+        self._pattern_regex = None
+
     def reset(self):
         """Reset the tab-completion settings."""
-        self._regex = None
+        self._invalidate()
         self._includes.clear()
 
     def add(self, attr: str):
         """Add an attribute to the include list."""
         self._includes.add(attr)
-        self._regex = None
+        self._invalidate()
 
     def remove(self, attr: str):
         """Remove an attribute from the include list."""
         self._includes.remove(attr)
-        self._regex = None
+        self._invalidate()
 
     def __repr__(self):
         return f'{self.__class__.__name__}(includes={self._includes})'
@@ -102,18 +207,32 @@ class TabCompletionHelperClass(_TabCompletionHelper):
     """
 
     cls: type['BaseInterface']
+    _filtered_dir_cache: typing.Optional[list[str]]
 
     def __init__(self, cls):
         self.cls = cls
         super().__init__()
+        _tab_class_helpers.add(self)
+
+    def _invalidate(self):
+        """Invalidate anything derived from the current includes."""
+        super()._invalidate()
+        self._filtered_dir_cache = None
 
     def reset(self):
         """Reset the attribute includes to those annotated in the class."""
         super().reset()
         whitelist = []
         for parent in self.cls.mro():
-            whitelist.extend(getattr(parent, 'tab_whitelist', []))
-
+            # Only read whitelists defined by the parent itself - inherited
+            # entries would otherwise be re-read once per descendant class
+            own_whitelist = parent.__dict__.get("tab_whitelist")
+            if own_whitelist:
+                whitelist.extend(own_whitelist)
+
+            # Component names must be expanded per parent: a subclass can
+            # remove a component (cpt = None) that an ancestor still
+            # contributes, so the class's own component_names is not enough
             if getattr(parent, "tab_component_names", False):
                 for cpt_name in parent.component_names:
                     if getattr(parent, cpt_name).kind != Kind.omitted:
@@ -149,6 +268,7 @@ class TabCompletionHelperInstance(_TabCompletionHelper):
     class_helper: TabCompletionHelperClass
     instance: 'BaseInterface'
     super_dir: typing.Callable[[], list[str]]
+    _super_dir_cache: typing.Optional[tuple[str, ...]]
 
     def __init__(self, instance, class_helper):
         assert isinstance(instance, BaseInterface), 'Must mix in BaseInterface'
@@ -158,22 +278,70 @@ class TabCompletionHelperInstance(_TabCompletionHelper):
         self.super_dir = super(BaseInterface, instance).__dir__
         super().__init__()
 
+    def _invalidate(self):
+        """Invalidate anything derived from the current includes."""
+        super()._invalidate()
+        self._super_dir_cache = None
+
     def reset(self):
         """Reset the attribute includes to that defined by the class."""
+        self._customized = False
         super().reset()
         self._includes = set(self.class_helper._includes)
 
-    def get_filtered_dir_list(self) -> list[str]:
-        """Get the dir list, filtered based on the whitelist."""
-        if self._regex is None:
-            self.build_regex()
+    def add(self, attr: str):
+        """Add an attribute to the include list."""
+        self._customized = True
+        super().add(attr)
+
+    def remove(self, attr: str):
+        """Remove an attribute from the include list."""
+        self._customized = True
+        super().remove(attr)
+
+    def _get_super_dir(self) -> tuple[str, ...]:
+        """
+        Get the unfiltered dir list, cached per instance.
+
+        Walking the full MRO for every tab completion dominates interactive
+        latency on large devices, and the listing only changes when dynamic
+        methods are added or removed through this helper.
+        """
+        if self._super_dir_cache is None:
+            self._super_dir_cache = tuple(self.super_dir())
+        return self._super_dir_cache
+
+    def _compute_filtered_dir_list(self) -> list[str]:
+        """Apply the whitelist filter to the unfiltered dir list."""
+        if self._literals is None:
+            self.build_filters()
 
+        literals = self._literals
+        pattern_regex = self._pattern_regex
+        # The set lookup is cheap; only try the regex on public names, since
+        # most of the unfiltered dir is underscore internals that no
+        # whitelist pattern is meant to match
         return [
             elem
-            for elem in self.super_dir()
-            if self._regex.fullmatch(elem)
+            for elem in self._get_super_dir()
+            if elem in literals
+            or (pattern_regex is not None and elem[:1] != '_'
+                and pattern_regex.fullmatch(elem))
         ]
 
+    def get_filtered_dir_list(self) -> list[str]:
+        """Get the dir list, filtered based on the whitelist."""
+        if self._customized:
+            # Instance-specific includes (e.g. presets): keep our own result
+            return self._compute_filtered_dir_list()
+
+        # Identical includes for every instance of the class: share one list
+        cache = self.class_helper._filtered_dir_cache
+        if cache is None:
+            cache = self._compute_filtered_dir_list()
+            self.class_helper._filtered_dir_cache = cache
+        return cache
+
     def get_dir(self) -> list[str]:
         """Get the dir list based on the engineering mode settings."""
         if get_engineering_mode():
@@ -301,60 +469,82 @@ class BaseInterface:
         status: str
             Formatted string with all relevant status information.
         """
-        lines = self._status_info_lines(status_info)
+        lines = []
+        self._status_info_lines(status_info, lines)
         if lines:
             return '\n'.join(lines)
         else:
             return f'{self.name}: No status available'
 
-    def _status_info_lines(self, status_info, prefix='', indent=0):
-        full_name = status_info['name']
-        if full_name.startswith(prefix):
-            name = full_name.replace(prefix, '', 1)
-        else:
-            name = full_name
-
-        if status_info['is_device']:
-            # Set up a tree view
-            header_lines = ['', f'{name}', '-' * len(name)]
-            data_lines = []
-            extra_keys = ('name', 'kind', 'is_device')
-            for key in extra_keys:
-                status_info.pop(key)
-            for key, value in status_info.items():
-                if isinstance(value, dict):
-                    # Go recursive
-                    inner = self._status_info_lines(value,
-                                                    prefix=full_name + '_',
-                                                    indent=2)
-                    data_lines.extend(inner)
-                else:
-                    # Record extra value
-                    data_lines.append(f'{key}: {value}')
-            if data_lines:
-                # Indent the subdevices
-                if indent:
-                    for i, line in enumerate(data_lines):
-                        data_lines[i] = ' ' * indent + line
-                return header_lines + data_lines
+    def _status_info_lines(self, status_info, out, prefix='', indent='',
+                           data_indent=''):
+        """
+        Append the formatted status lines for one node to ``out``.
+
+        The ``out`` list is shared by the entire traversal so that nested
+        subdevices append their lines directly instead of building and
+        copying intermediate lists at every level. ``indent`` applies to
+        this node's header, ``data_indent`` to its data lines.
+
+        The tree is walked with an explicit worklist rather than recursion,
+        so deep device trees do not pay a Python call frame per node.
+        """
+        stack = deque([('node', status_info, prefix, indent, data_indent)])
+        while stack:
+            frame = stack.pop()
+            tag = frame[0]
+            if tag == 'line':
+                # A data line deferred to keep dict order with subdevices
+                out.append(frame[1])
+                continue
+            if tag == 'trim':
+                if len(out) == frame[1] + 3:
+                    # No data = do not print header
+                    del out[frame[1]:]
+                continue
+
+            _, status_info, prefix, indent, data_indent = frame
+            full_name = status_info['name']
+            if full_name.startswith(prefix):
+                name = full_name.replace(prefix, '', 1)
             else:
-                # No data = do not print header
-                return []
-        else:
-            # Show the name/value pair for a signal
-            value = status_info['value']
-            units = status_info.get('units') or ''
-            if units:
-                units = f' [{units}]'
-            value_text = str(value)
-            if '\n' in value_text:
-                # Multiline values (arrays) need special handling
-                value_lines = value_text.split('\n')
-                for i, line in enumerate(value_lines):
-                    value_lines[i] = ' ' * 2 + line
-                return [f'{name}:'] + value_lines
+                name = full_name
+
+            if status_info['is_device']:
+                # Set up a tree view; the trim frame drops the header again
+                # if no data followed it
+                mark = len(out)
+                out.append(indent)
+                out.append(indent + name)
+                out.append(indent + '-' * len(name))
+                extra_keys = ('name', 'kind', 'is_device')
+                for key in extra_keys:
+                    status_info.pop(key)
+                stack.append(('trim', mark))
+                frames = []
+                for key, value in status_info.items():
+                    if isinstance(value, dict):
+                        # Expand the subdevice in a later iteration
+                        frames.append(('node', value, full_name + '_',
+                                       data_indent, data_indent + '  '))
+                    else:
+                        # Record extra value
+                        frames.append(('line', f'{data_indent}{key}: {value}'))
+                stack.extend(reversed(frames))
             else:
-                return [f'{name}: {value}{units}']
+                # Show the name/value pair for a signal
+                value = status_info['value']
+                units = status_info.get('units') or ''
+                if units:
+                    units = f' [{units}]'
+                value_text = str(value)
+                if '\n' in value_text:
+                    # Multiline values (arrays) need special handling
+                    out.append(f'{indent}{name}:')
+                    for line in value_text.split('\n'):
+                        out.append(f'{indent}  {line}')
+                else:
+                    out.append(f'{indent}{name}: {value}{units}')
 
     def status_info(self):
         """
@@ -373,7 +563,10 @@ class BaseInterface:
         def subdevice_filter(info):
             return bool(info['kind'] & Kind.normal)
 
-        return ophydobj_info(self, subdevice_filter=subdevice_filter)
+        # One connection snapshot per status call: signal.connected can do
+        # real work, so don't re-check it for signals we see again
+        return ophydobj_info(self, subdevice_filter=subdevice_filter,
+                             conn_cache={})
 
     def post_elog_status(self):
         """
@@ -416,58 +609,67 @@ class BaseInterface:
 
 
 def get_name(obj, default):
+    # getattr with a fallback: these helpers run O(components) times per
+    # status call, so avoid raising exceptions in the common path
+    name = getattr(obj, 'name', None)
+    if name is not None:
+        return name
     try:
-        return obj.name
-    except AttributeError:
-        try:
-            return str(obj)
-        except Exception:
-            return default
+        return str(obj)
+    except Exception:
+        return default
 
 
 def get_kind(obj):
-    try:
-        return obj.kind
-    except Exception:
-        return Kind.omitted
+    return getattr(obj, 'kind', Kind.omitted)
 
 
-def get_value(signal):
+def get_value(signal, conn_cache=None):
+    # Minimize waiting, we aren't collecting data we're showing info
+    if conn_cache is not None:
+        connected = conn_cache.get(id(signal))
+        if connected is None:
+            connected = signal.connected
+            conn_cache[id(signal)] = connected
+    else:
+        connected = signal.connected
+    if not connected:
+        return None
     try:
-        # Minimize waiting, we aren't collecting data we're showing info
-        if signal.connected:
-            return signal.get(timeout=0.1, connection_timeout=0.1)
+        # Only the network-facing get needs the exception guard
+        return signal.get(timeout=0.1, connection_timeout=0.1)
     except Exception:
-        pass
-    return None
+        return None
 
 
 def get_units(signal):
+    # Plain getattr/get lookups: this runs for every signal on every
+    # status_info call, so avoid raising exceptions in the common path
+    metadata = getattr(signal, 'metadata', None)
     attrs = ('derived_units', 'units', 'egu')
     for attr in attrs:
-        try:
-            value = getattr(signal, attr, None) or signal.metadata[attr]
-            if isinstance(value, str):
-                return value
-        except Exception:
-            ...
+        # Falsy values (e.g. an empty egu string) fall through to the
+        # metadata dict, and to the next attribute if that misses too
+        value = getattr(signal, attr, None) or (
+            metadata.get(attr) if metadata is not None else None)
+        if isinstance(value, str):
+            return value
 
 
-def ophydobj_info(obj, subdevice_filter=None, devices=None):
+def ophydobj_info(obj, subdevice_filter=None, devices=None, conn_cache=None):
     if isinstance(obj, Signal):
-        return signal_info(obj)
+        return signal_info(obj, conn_cache=conn_cache)
     elif isinstance(obj, Device):
         return device_info(obj, subdevice_filter=subdevice_filter,
-                           devices=devices)
+                           devices=devices, conn_cache=conn_cache)
     elif isinstance(obj, PositionerBase):
         return positionerbase_info(obj)
     else:
         return {}
 
 
-def device_info(device, subdevice_filter=None, devices=None):
-    if devices is None:
-        devices = set()
+def _device_info_header(device):
+    """Collect the non-component portion of a device's info dict."""
     name = get_name(device, default='device')
     kind = get_kind(device)
     info = dict(name=name, kind=kind, is_device=True)
@@ -507,21 +709,50 @@ def device_info(device, subdevice_filter=None, devices=None):
     except Exception:
         pass
 
-    if device not in devices:
+    return info
+
+
+def device_info(device, subdevice_filter=None, devices=None, conn_cache=None):
+    if devices is None:
+        devices = set()
+    top_info = _device_info_header(device)
+
+    # Signal values are collected during the traversal and fetched together
+    # at the end, so disconnected PVs stall once in parallel rather than
+    # serializing one 100 ms timeout per signal
+    pending_values = []
+
+    # Fill in components with an explicit worklist instead of recursion:
+    # deep device trees would otherwise pay a Python call frame per subdevice
+    stack = deque([(device, top_info)])
+    while stack:
+        device, info = stack.pop()
+        if device in devices:
+            continue
         devices.add(device)
-        for cpt_name, cpt_desc in device._sig_attrs.items():
+        name = info['name']
+        children = []
+        cls = type(device)
+        # The component skips depend only on the class, so evaluate them
+        # once per Device subclass instead of once per call per component.
+        # Check cls.__dict__ directly so subclasses don't inherit a parent's
+        # (possibly shorter) listing.
+        cpt_names = cls.__dict__.get('_status_info_cpts')
+        if cpt_names is None:
             # Skip lazy signals outright in all cases
             # Usually these are lazy because they take too long to getattr
-            if cpt_desc.lazy:
-                continue
             # Skip attribute signals
             # Indeterminate get times, no real connected bool, etc.
-            if issubclass(cpt_desc.cls, AttributeSignal):
-                continue
             # Skip not implemented signals
             # They never have interesting information
-            if issubclass(cpt_desc.cls, NotImplementedSignal):
-                continue
+            cpt_names = tuple(
+                cpt_name for cpt_name, cpt_desc in cls._sig_attrs.items()
+                if not cpt_desc.lazy
+                and not issubclass(cpt_desc.cls,
+                                   (AttributeSignal, NotImplementedSignal))
+            )
+            cls._status_info_cpts = cpt_names
+        for cpt_name in cpt_names:
             try:
                 cpt = getattr(device, cpt_name)
             except AttributeError:
@@ -529,8 +760,6 @@ def device_info(device, subdevice_filter=None, devices=None):
                 logger.debug(f'Getattr {name}.{cpt_name} failed.',
                              exc_info=True)
                 continue
-            cpt_info = ophydobj_info(cpt, subdevice_filter=subdevice_filter,
-                                     devices=devices)
             if 'position' in info:
                 # Drop some potential duplicate keys for positioners
                 try:
@@ -541,15 +770,47 @@ def device_info(device, subdevice_filter=None, devices=None):
                 if cpt_name in ('readback', 'user_readback'):
                     continue
 
+            subdevice = None
+            pending = None
+            if isinstance(cpt, Signal):
+                cpt_info = signal_info(cpt, fetch_value=False)
+                pending = (cpt_info, cpt)
+            elif isinstance(cpt, Device):
+                # Insert the header now, expand components in a later loop
+                cpt_info = _device_info_header(cpt)
+                subdevice = (cpt, cpt_info)
+            elif isinstance(cpt, PositionerBase):
+                cpt_info = positionerbase_info(cpt)
+            else:
+                cpt_info = {}
+
             if not callable(subdevice_filter) or subdevice_filter(cpt_info):
                 info[cpt_name] = cpt_info
-    return info
-
-
-def signal_info(signal):
+                if subdevice is not None:
+                    children.append(subdevice)
+                if pending is not None:
+                    pending_values.append(pending)
+        # Reversed so the pop() order matches a depth-first traversal
+        stack.extend(reversed(children))
+
+    if len(pending_values) == 1:
+        cpt_info, sig = pending_values[0]
+        cpt_info['value'] = get_value(sig, conn_cache=conn_cache)
+    elif pending_values:
+        with ThreadPoolExecutor(
+                max_workers=min(len(pending_values), 16)) as executor:
+            values = executor.map(
+                functools.partial(get_value, conn_cache=conn_cache),
+                [sig for _, sig in pending_values])
+            for (cpt_info, _), value in zip(pending_values, values):
+                cpt_info['value'] = value
+    return top_info
+
+
+def signal_info(signal, fetch_value=True, conn_cache=None):
     name = get_name(signal, default='signal')
     kind = get_kind(signal)
-    value = get_value(signal)
+    value = get_value(signal, conn_cache=conn_cache) if fetch_value else None
     units = get_units(signal)
     return dict(name=name, kind=kind, is_device=False, value=value,
                 units=units)
@@ -578,6 +839,9 @@ def set_engineering_mode(expert):
 
     global engineering_mode
     engineering_mode = bool(expert)
+    # Flush shared dir listings so no stale entries survive the mode switch
+    for helper in _tab_class_helpers:
+        helper._filtered_dir_cache = None
 
 
 def get_engineering_mode():
@@ -708,8 +972,15 @@ class MvInterface(BaseInterface):
 
         try:
             self._mov_ev.clear()
+            last_pos = None
             while not self._mov_ev.is_set():
-                print(f"\r {self.wm():4f}", end=" ")
+                pos = self.wm()
+                if pos != last_pos:
+                    # Write directly and skip unchanged values: the print
+                    # syscall dominates this loop on slow terminals
+                    sys.stdout.write(f"\r {pos:4f} ")
+                    sys.stdout.flush()
+                    last_pos = pos
                 self._mov_ev.wait(0.1)
         except KeyboardInterrupt:
             pass
@@ -755,7 +1026,15 @@ class FltMvInterface(MvInterface):
         if self.presets.sync_needed():
             self.presets.sync()
 
-        return super().__dir__()
+        listing = super().__dir__()
+        # Preset methods are dispatched via __getattr__ rather than living
+        # in the instance __dict__, so list them explicitly
+        preset_methods = self.presets._preset_methods
+        if preset_methods:
+            listing = list(listing)
+            listing.extend(name for name in preset_methods
+                           if name not in listing)
+        return listing
 
     def __getattribute__(self, name: str):
         if (any((name.startswith(prefix)) for prefix in ['mv_', 'wm_', 'umv_'])
@@ -764,6 +1043,21 @@ class FltMvInterface(MvInterface):
 
         return super().__getattribute__(name)
 
+    def __getattr__(self, name: str):
+        # Dispatch preset methods without binding one MethodType per preset
+        # per device; see Presets._register_preset_method.
+        if name.startswith(('mv_', 'umv_', 'wm_')):
+            presets = self.__dict__.get('presets')
+            if presets is not None:
+                method = presets._preset_methods.get(name)
+                if method is not None:
+                    return MethodType(method, self)
+        try:
+            getattr_fallback = super().__getattr__
+        except AttributeError:
+            raise AttributeError(name) from None
+        return getattr_fallback(name)
+
     def wm(self):
         pos = super().wm()
         try:
@@ -823,7 +1117,7 @@ class FltMvInterface(MvInterface):
         except ophyd.utils.LimitError:
             return
 
-        pgb = AbsProgressBar([status])
+        pgb = _abs_progress_bar()([status])
         try:
             status.wait()
             # Avoid race conditions involving the final update
@@ -880,10 +1174,15 @@ class FltMvInterface(MvInterface):
                 upper_limit = self.limits[0]+100
             else:
                 upper_limit = self.limits[1]
-            limit_plot = []
-            for x in range(lower_limit, upper_limit):
-                limit_plot.append(x)
-            plt.plot(limit_plot)
+            if upper_limit - lower_limit > 10_000:
+                # No need for millions of points just to span the limits,
+                # but the x-axis must still cover the full span: ginput
+                # uses the clicked x-coordinate as the move target
+                limit_x = np.linspace(0, upper_limit - lower_limit, 1000)
+                limit_plot = np.linspace(lower_limit, upper_limit, 1000)
+                plt.plot(limit_x, limit_plot)
+            else:
+                plt.plot(np.arange(lower_limit, upper_limit))
         pos = plt.ginput(1)[0][0]
         try:
             self.move(pos, timeout=timeout)
@@ -935,9 +1234,81 @@ def setup_preset_paths(defer_loading: bool = False, **paths):
     for k, v in paths.items():
         Presets._paths[k] = Path(v)
     for preset in Presets._registry:
+        preset._path_cache.clear()
         preset.sync(defer_loading=defer_loading)
 
 
+# Docstring templates for the dynamically generated preset methods.
+# %-substitution at method creation time is cheaper than running the full
+# str.format machinery for every preset on every sync, and keeps working
+# if the interpreter strips function docstrings (-OO).
+_ADD_PRE_DOC = """\
+Add a preset position of type "%s".
+
+Parameters
+----------
+name : str
+    The name of the new preset position.
+
+value : float, optional
+    The value of the new preset_position.  If unspecified, uses
+    the current position.
+
+comment : str, optional
+    A comment to associate with the preset position.
+"""
+
+_ADD_HERE_PRE_DOC = """\
+Add a preset of the current position of type "%s".
+
+Parameters
+----------
+name : str
+    The name of the new preset position.
+
+comment : str, optional
+    A comment to associate with the preset position.
+"""
+
+_MV_PRE_DOC = """\
+Move to the %s preset position.
+
+Parameters
+----------
+timeout : float, optional
+    If provided, the mover will throw an error if motion takes
+    longer than timeout to complete. If omitted, the mover's
+    default timeout will be use.
+
+wait : bool, optional
+    If `True`, wait for motion completion before
+    returning. Defaults to :keyword:`False`.
+"""
+
+_UMV_PRE_DOC = """\
+Update move to the %s preset position.
+
+Parameters
+----------
+timeout : float, optional
+    If provided, the mover will throw an error if motion takes
+    longer than timeout to complete. If omitted, the mover's
+    default timeout will be use.
+"""
+
+_WM_PRE_DOC = """\
+Check the offset from the %s preset position.
+
+Returns
+-------
+offset : Optional[float, str]
+    How far we are from the preset position. If this is near zero,
+    we are at the position. If this positive, the preset position
+    is in the positive direction from us.
+    If the current position is unknown, return "Unknown".
+"""
+
+
 class Presets:
     """
     Manager for device preset positions.
@@ -964,28 +1335,50 @@ class Presets:
 
     _registry = WeakSet()
     _paths = {}
+    # Parsed preset files shared by every Presets object, keyed by path
+    # and validated against the file's (st_mtime_ns, st_size) signature
+    _file_cache = {}
 
     def __init__(self, device):
         self._device = device
         self._methods = []
+        self._preset_methods = {}
+        self._preset_names = []
+        self._preset_values = np.empty(0)
         self._fd = None
         self._registry.add(self)
         self.name = device.name + '_presets'
         self._mtimes = {}
+        self._path_cache = {}
         self.sync()
 
     def _path(self, preset_type) -> Path:
         """Utility function to get the preset file :class:`~pathlib.Path`."""
-        path = self._paths[preset_type] / (self._device.name + '.yml')
+        path = self._path_cache.get(preset_type)
+        if path is None:
+            path = self._paths[preset_type] / (self._device.name + '.yml')
+            self._path_cache[preset_type] = path
         logger.debug('select presets path %s', path)
         return path
 
     def _read(self, preset_type):
         """Utility function to get a particular preset's datum dictionary."""
         logger.debug('read presets for %s', self._device.name)
+        path = self._path(preset_type)
+        # Locking is unchanged so contention behaves exactly as before;
+        # only the YAML parse is skipped when the file has not changed
         with self._file_open_rlock(preset_type) as f:
+            stat = os.fstat(f.fileno())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == signature:
+                # Deep copy because callers mutate the returned data
+                return copy.deepcopy(cached[1])
             f.seek(0)
-            return yaml.full_load(f) or {}
+            yaml, loader, _ = _yaml_tools()
+            data = yaml.load(f, Loader=loader) or {}
+            Presets._file_cache[path] = (signature, copy.deepcopy(data))
+        return data
 
     def _write(self, preset_type, data):
         """
@@ -994,8 +1387,10 @@ class Presets:
         logger.debug('write presets for %s', self._device.name)
         with self._file_open_rlock(preset_type) as f:
             f.seek(0)
-            yaml.dump(data, f, default_flow_style=False)
+            yaml, _, dumper = _yaml_tools()
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
             f.truncate()
+        self._file_cache.pop(self._path(preset_type), None)
 
     @contextmanager
     def _file_open_rlock(self, preset_type, timeout=1.0):
@@ -1074,8 +1469,12 @@ class Presets:
             if not path.exists():
                 path.touch()
                 path.chmod(0o666)
-            with self._file_open_rlock(preset_type):
-                data = self._read(preset_type)
+            # Read, modify, and write back under one lock acquisition
+            # rather than re-entering the lock context for each step
+            with self._file_open_rlock(preset_type) as f:
+                f.seek(0)
+                yaml, loader, dumper = _yaml_tools()
+                data = yaml.load(f, Loader=loader) or {}
                 if value is None and comment is not None:
                     value = data[name]['value']
                 if value is not None:
@@ -1094,7 +1493,11 @@ class Presets:
                     data[name]['active'] = True
                 else:
                     data[name]['active'] = False
-                self._write(preset_type, data)
+                f.seek(0)
+                yaml.dump(data, f, Dumper=dumper,
+                          default_flow_style=False)
+                f.truncate()
+            self._file_cache.pop(self._path(preset_type), None)
         except BlockingIOError:
             self._log_flock_error()
 
@@ -1136,20 +1539,34 @@ class Presets:
         """
 
         logger.debug('call %s presets._create_methods()', self._device.name)
+        preset_values = []
         for preset_type in self._paths.keys():
             add, add_here = self._make_add(preset_type)
             self._register_method(self, 'add_' + preset_type, add)
             self._register_method(self, 'add_here_' + preset_type, add_here)
         for preset_type, data in self._cache.items():
             for name, info in data.items():
-                if info['active']:
+                # Deactivated presets get no methods and stay out of the
+                # state() arrays; entries without the flag count as active
+                if info.get('active', True):
                     mv, umv = self._make_mv_pre(preset_type, name)
                     wm = self._make_wm_pre(preset_type, name)
-                    self._register_method(self._device, 'mv_' + name, mv)
-                    self._register_method(self._device, 'umv_' + name, umv)
-                    self._register_method(self._device, 'wm_' + name, wm)
+                    self._register_preset_method('mv_' + name, mv)
+                    self._register_preset_method('umv_' + name, umv)
+                    self._register_preset_method('wm_' + name, wm)
+                    # Cached positions so state() can compare offsets
+                    # without re-reading the device once per preset
+                    self._preset_names.append(name)
+                    try:
+                        value = float(info['value'])
+                    except (TypeError, ValueError, KeyError):
+                        # Hand-edited files can hold missing or
+                        # non-numeric values; state() masks these out
+                        value = np.nan
+                    preset_values.append(value)
                     setattr(self.positions, name,
                             PresetPosition(self, preset_type, name))
+        self._preset_values = np.asarray(preset_values, dtype=float)
 
     def _register_method(self, obj, method_name, method):
         """
@@ -1166,6 +1583,25 @@ class Presets:
             # obj._tab: TabCompletionHelperInstance
             obj._tab.add(method_name)
 
+    def _register_preset_method(self, method_name, method):
+        """
+        Register a preset method for dispatch on the device.
+
+        Rather than binding a fresh :class:`~types.MethodType` onto the
+        device for every preset, the plain function is stored here and
+        :meth:`FltMvInterface.__getattr__` binds it on demand. This keeps
+        the device's instance ``__dict__`` small no matter how many presets
+        are defined.
+        """
+
+        logger.debug('register method %s to %s', method_name,
+                     self._device.name)
+        self._methods.append((self._device, method_name))
+        self._preset_methods[method_name] = method
+        if hasattr(self._device, '_tab'):
+            # _tab: TabCompletionHelperInstance
+            self._device._tab.add(method_name)
+
     def _make_add(self, preset_type):
         """
         Create the functions that add preset positions.
@@ -1176,21 +1612,6 @@ class Presets:
         """
 
         def add(self, name, value=None, comment=None):
-            """
-            Add a preset position of type "{}".
-
-            Parameters
-            ----------
-            name : str
-                The name of the new preset position.
-
-            value : float, optional
-                The value of the new preset_position.  If unspecified, uses
-                the current position.
-
-            comment : str, optional
-                A comment to associate with the preset position.
-            """
             if value is None:
                 value = self._device.wm()
             self._update(preset_type, name, value=value,
@@ -1198,22 +1619,10 @@ class Presets:
             self.sync()
 
         def add_here(self, name, comment=None):
-            """
-            Add a preset of the current position of type "{}".
-
-            Parameters
-            ----------
-            name : str
-                The name of the new preset position.
-
-            comment : str, optional
-                A comment to associate with the preset position.
-            """
-
             add(self, name, self._device.wm(), comment=comment)
 
-        add.__doc__ = add.__doc__.format(preset_type)
-        add_here.__doc__ = add_here.__doc__.format(preset_type)
+        add.__doc__ = _ADD_PRE_DOC % preset_type
+        add_here.__doc__ = _ADD_HERE_PRE_DOC % preset_type
         return add, add_here
 
     def _make_mv_pre(self, preset_type, name):
@@ -1226,41 +1635,15 @@ class Presets:
         """
 
         def mv_pre(self, timeout=None, wait=False):
-            """
-            Move to the {} preset position.
-
-            Parameters
-            ----------
-            timeout : float, optional
-                If provided, the mover will throw an error if motion takes
-                longer than timeout to complete. If omitted, the mover's
-                default timeout will be use.
-
-            wait : bool, optional
-                If `True`, wait for motion completion before
-                returning. Defaults to :keyword:`False`.
-            """
-
             pos = self.presets._cache[preset_type][name]['value']
             self.mv(pos, timeout=timeout, wait=wait)
 
         def umv_pre(self, timeout=None):
-            """
-            Update move to the {} preset position.
-
-            Parameters
-            ----------
-            timeout : float, optional
-                If provided, the mover will throw an error if motion takes
-                longer than timeout to complete. If omitted, the mover's
-                default timeout will be use.
-            """
-
             pos = self.presets._cache[preset_type][name]['value']
             self.umv(pos, timeout=timeout)
 
-        mv_pre.__doc__ = mv_pre.__doc__.format(name)
-        umv_pre.__doc__ = umv_pre.__doc__.format(name)
+        mv_pre.__doc__ = _MV_PRE_DOC % name
+        umv_pre.__doc__ = _UMV_PRE_DOC % name
         return mv_pre, umv_pre
 
     def _make_wm_pre(self, preset_type, name):
@@ -1272,17 +1655,6 @@ class Presets:
         """
 
         def wm_pre(self):
-            """
-            Check the offset from the {} preset position.
-
-            Returns
-            -------
-            offset : Optional[float, str]
-                How far we are from the preset position. If this is near zero,
-                we are at the position. If this positive, the preset position
-                is in the positive direction from us.
-                If the current position is unknown, return "Unknown".
-            """
             preset_pos = self.presets._cache[preset_type][name]['value']
             # here we expect self: FltMvInterface
             curr_pos = self.wm()
@@ -1294,20 +1666,30 @@ class Presets:
 
             return pos
 
-        wm_pre.__doc__ = wm_pre.__doc__.format(name)
+        wm_pre.__doc__ = _WM_PRE_DOC % name
         return wm_pre
 
     def _remove_methods(self):
         """Remove all methods created in the last call to _create_methods."""
         logger.debug('call %s presets._remove_methods()', self._device.name)
+        by_obj = defaultdict(set)
         for obj, method_name in self._methods:
-            try:
-                delattr(obj, method_name)
-            except AttributeError:
-                pass
-            if hasattr(obj, '_tab'):
-                obj._tab.remove(method_name)
+            by_obj[obj].add(method_name)
+        for obj, method_names in by_obj.items():
+            obj_dict = obj.__dict__
+            # Only names that were actually setattr'ed (the add_* methods)
+            # appear in the instance dict; intersecting skips the rest
+            # without delattr's descriptor walk or a try/except per name
+            for method_name in method_names & obj_dict.keys():
+                del obj_dict[method_name]
+            tab = getattr(obj, '_tab', None)
+            if tab is not None:
+                for method_name in method_names:
+                    tab.remove(method_name)
         self._methods = []
+        self._preset_methods = {}
+        self._preset_names = []
+        self._preset_values = np.empty(0)
         self.positions = SimpleNamespace()
 
     @property
@@ -1325,18 +1707,21 @@ class Presets:
         state.
         """
         state = 'Unknown'
-        closest = 0.5
-        for device, method_name in self._methods:
-            if method_name.startswith('wm_'):
-                state_name = method_name.replace('wm_', '', 1)
-                wm_state = getattr(device, method_name)
-                state_val = wm_state()
-                if not isinstance(state_val, numbers.Real):
-                    continue
-                diff = abs(state_val)
-                if diff < closest:
-                    state = state_name
-                    closest = diff
+        if not self._preset_names:
+            return state
+        # One device read for the whole sweep: the preset positions are
+        # already-known floats, so only the current position costs anything
+        current = self._device.wm()
+        if not isinstance(current, numbers.Real):
+            # Current position is not known or unset
+            return state
+        diffs = np.abs(self._preset_values - current)
+        # Presets with bad values were recorded as NaN above; never let
+        # them win the argmin over a real match
+        diffs = np.where(np.isfinite(diffs), diffs, np.inf)
+        index = int(np.argmin(diffs))
+        if diffs[index] < 0.5:
+            return self._preset_names[index]
         return state
 
     def sync_needed(self) -> bool:
@@ -1363,6 +1748,8 @@ class PresetPosition:
         The name of this preset position.
     """
 
+    __slots__ = ('_presets', '_preset_type', '_name')
+
     def __init__(self, presets, preset_type, name):
         self._presets = presets
         self._preset_type = preset_type
@@ -1435,6 +1822,14 @@ class PresetPosition:
         return str(self.pos)
 
 
+@functools.lru_cache(maxsize=1)
+def _tweak_keys():
+    """Resolve the tweak key constants from utils once, on first use."""
+    return (utils.arrow_up, utils.arrow_down, utils.arrow_left,
+            utils.arrow_right, utils.shift_arrow_up, utils.shift_arrow_down,
+            utils.plus, utils.minus)
+
+
 def tweak_base(*args, scale=0.1):
     """
     Base function to control motors with the arrow keys.
@@ -1453,23 +1848,21 @@ def tweak_base(*args, scale=0.1):
     Both q and ctrl+c will quit the tweak between moves.
     """
 
-    up = utils.arrow_up
-    down = utils.arrow_down
-    left = utils.arrow_left
-    right = utils.arrow_right
-    shift_up = utils.shift_arrow_up
-    shift_down = utils.shift_arrow_down
-    plus = utils.plus
-    minus = utils.minus
+    (up, down, left, right,
+     shift_up, shift_down, plus, minus) = _tweak_keys()
     abs_status = '{}: {:.4f}'
     exp_status = '{}: {:.4e}'
 
+    # Bind the motors and key sets once; the loop below runs per keystroke
+    mot0 = args[0]
+    mot1 = args[1] if len(args) > 1 else None
+
     if len(args) == 1:
-        move_keys = (left, right)
-        scale_keys = (up, down, plus, minus, shift_up, shift_down)
+        move_keys = frozenset((left, right))
+        scale_keys = frozenset((up, down, plus, minus, shift_up, shift_down))
     elif len(args) == 2:
-        move_keys = (left, right, up, down)
-        scale_keys = (plus, minus, shift_up, shift_down)
+        move_keys = frozenset((left, right, up, down))
+        scale_keys = frozenset((plus, minus, shift_up, shift_down))
 
     def show_status():
         if scale >= 0.0001:
@@ -1510,13 +1903,13 @@ def tweak_base(*args, scale=0.1):
         """Function used to know when and the direction to move the motor."""
         try:
             if direction == left:
-                args[0].umvr(-scale, log=False, newline=False)
+                mot0.umvr(-scale, log=False, newline=False)
             elif direction == right:
-                args[0].umvr(scale, log=False, newline=False)
+                mot0.umvr(scale, log=False, newline=False)
             elif direction == up:
-                args[1].umvr(scale, log=False, newline=False)
+                mot1.umvr(scale, log=False, newline=False)
             elif direction == down:
-                args[1].umvr(-scale, log=False, newline=False)
+                mot1.umvr(-scale, log=False, newline=False)
         except Exception as exc:
             logger.error('Error in tweak move: %s', exc)
             logger.debug('', exc_info=True)
@@ -1525,10 +1918,11 @@ def tweak_base(*args, scale=0.1):
     logger.info('Started tweak of ' + ', '.join(start_text))
 
     # Loop takes in user key input and stops when 'q' is pressed
+    get_input = utils.get_input
     is_input = True
     while is_input is True:
         show_status()
-        inp = utils.get_input()
+        inp = get_input()
         if inp in ('q', None):
             is_input = False
         elif inp in move_keys:
@@ -1541,73 +1935,94 @@ def tweak_base(*args, scale=0.1):
     logger.info('Tweak complete')
 
 
-class AbsProgressBar(ProgressBar):
-    """Progress bar that displays the absolute position as well."""
-    def __init__(self, *args, **kwargs):
-        self._last_position = None
-        self._name = None
-        self._no_more = False
-        self._manual_cbs = []
-        self.has_updated = False
-        super().__init__(*args, **kwargs)
-
-        # Allow manual updates for a final status print
-        for i, obj in enumerate(self.status_objs):
-            self._manual_cbs.append(functools.partial(self._status_cb, i))
+@functools.lru_cache(maxsize=1)
+def _abs_progress_bar():
+    """
+    Define and return the :class:`AbsProgressBar` class.
 
-    def _status_cb(self, pos, status):
-        self.update(pos, name=self._name, current=self._last_position)
+    Deferred so that importing this module does not pull in bluesky, which
+    is only needed once someone calls :meth:`FltMvInterface.umv`.
+    """
+    from bluesky.utils import ProgressBar
+
+    class AbsProgressBar(ProgressBar):
+        """Progress bar that displays the absolute position as well."""
+        def __init__(self, *args, **kwargs):
+            self._last_position = None
+            self._name = None
+            self._no_more = False
+            self._manual_cbs = []
+            self.has_updated = False
+            super().__init__(*args, **kwargs)
+
+            # Allow manual updates for a final status print
+            # Default-arg closures call faster than functools.partial
+            for i, obj in enumerate(self.status_objs):
+                self._manual_cbs.append(
+                    lambda status, i=i: self._status_cb(i, status))
+
+        def _status_cb(self, pos, status):
+            self.update(pos, name=self._name, current=self._last_position)
+
+        def update(self, *args, name=None, current=None, **kwargs):
+            # Escape hatch to avoid post-command prints
+            if self._no_more:
+                return
+
+            # Get cached position and name so they can always be displayed
+            current = current or self._last_position
+            self._name = self._name or name
+            name = self._name
+
+            if isinstance(current, typing.Sequence) and len(current) == 1:
+                # Single-valued pseudo positioner values can come through
+                # here.
+                current, = current
 
-    def update(self, *args, name=None, current=None, **kwargs):
-        # Escape hatch to avoid post-command prints
-        if self._no_more:
-            return
+            if isinstance(current, numbers.Real):
+                current = float(current)
 
-        # Get cached position and name so they can always be displayed
-        current = current or self._last_position
-        self._name = self._name or name
-        name = self._name
+                # Expand name to include position to display with progress bar
+                # TODO: can we get access to the signal's precision?
+                if 0.0 < abs(current) < 1e-6:
+                    fmt = '{}: ({:.4g})'
+                else:
+                    fmt = '{}: ({:.4f})'
 
-        try:
-            if isinstance(current, typing.Sequence):
-                # Single-valued pseudo positioner values can come through here.
-                assert len(current) == 1
-                current, = current
+                name = fmt.format(name, current)
+                self._last_position = current
+            else:
+                # Fallback if there is no position data at all
+                name = name or self._name or 'motor'
 
-            current = float(current)
+            try:
+                # Actually draw the bar
+                super().update(*args, name=name, current=current, **kwargs)
+                if not self._no_more:
+                    self.has_updated = True
+            except Exception:
+                # Print method failure should never print junk to the screen
+                logger.debug('Error in progress bar update', exc_info=True)
 
-            # Expand name to include position to display with progress bar
-            # TODO: can we get access to the signal's precision?
-            if 0.0 < abs(current) < 1e-6:
-                fmt = '{}: ({:.4g})'
-            else:
-                fmt = '{}: ({:.4f})'
+        def manual_update(self):
+            """Execute a manual update of the progress bar."""
+            for cb, status in zip(self._manual_cbs, self.status_objs):
+                cb(status)
 
-            name = fmt.format(name, current)
-            self._last_position = current
-        except Exception:
-            # Fallback if there is no position data at all
-            name = name or self._name or 'motor'
+        def no_more_updates(self):
+            """Prevent all future prints from the progress bar."""
+            self.fp = NullFile()
+            self._no_more = True
+            self._manual_cbs.clear()
 
-        try:
-            # Actually draw the bar
-            super().update(*args, name=name, current=current, **kwargs)
-            if not self._no_more:
-                self.has_updated = True
-        except Exception:
-            # Print method failure should never print junk to the screen
-            logger.debug('Error in progress bar update', exc_info=True)
+    return AbsProgressBar
 
-    def manual_update(self):
-        """Execute a manual update of the progress bar."""
-        for cb, status in zip(self._manual_cbs, self.status_objs):
-            cb(status)
 
-    def no_more_updates(self):
-        """Prevent all future prints from the progress bar."""
-        self.fp = NullFile()
-        self._no_more = True
-        self._manual_cbs.clear()
+def __getattr__(name):
+    # Keep AbsProgressBar importable without paying for bluesky up front
+    if name == 'AbsProgressBar':
+        return _abs_progress_bar()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class NullFile:
@@ -1635,6 +2050,14 @@ class LegacyLightpathMixin(OphydObject):
         self._lightpath_values = {}
         self._lightpath_ready = False
         self._retry_lightpath = False
+        self._lp_last_state = None
+        self._lp_cpt_count = len(self.lightpath_cpts)
+        # Callbacks start in the pre-ready regime; see _update_lightpath
+        self._lp_update_impl = self._lp_update_cold
+        # Plain attributes, refreshed in _update_lightpath: lightpath UIs
+        # poll these, and a property costs a descriptor dispatch per read
+        self.inserted = False
+        self.removed = False
         super().__init__(*args, **kwargs)
 
     def __init_subclass__(cls, **kwargs):
@@ -1659,35 +2082,59 @@ class LegacyLightpathMixin(OphydObject):
 
     def _update_lightpath(self, *args, obj, **kwargs):
         try:
-            # Universally cache values
-            self._lightpath_values[obj] = kwargs
-            # Only do the first lightpath state once all cpts have chimed in
-            if len(self._lightpath_values) >= len(self.lightpath_cpts):
-                self._retry_lightpath = False
-                # Pass user function the full set of values
-                self._set_lightpath_states(self._lightpath_values)
-                self._lightpath_ready = not self._retry_lightpath
-                if self._lightpath_ready:
-                    # Tell lightpath to update
-                    self._run_subs(sub_type=self.SUB_STATE)
-                elif self._retry_lightpath and not self._destroyed:
-                    # Use this when the device wasn't ready to set states
-                    kw = dict(obj=obj)
-                    kw.update(kwargs)
-                    utils.schedule_task(self._update_lightpath,
-                                        args=args, kwargs=kw, delay=1.0)
+            # Thin trampoline: the component subscriptions hold this method,
+            # so the pre-ready and steady-state regimes are swapped behind
+            # it rather than by rebinding the callback itself
+            self._lp_update_impl(args, obj, kwargs)
         except Exception:
             # Without this, callbacks fail silently
             logger.exception('Error in lightpath update callback for %s.',
                              self.name)
 
-    @property
-    def inserted(self):
-        return self._lightpath_ready and bool(self._inserted)
+    def _lp_update_cold(self, args, obj, kwargs):
+        """Pre-ready regime: gate until every cpt has chimed in once."""
+        # Universally cache values
+        self._lightpath_values[obj] = kwargs
+        # Only do the first lightpath state once all cpts have chimed in
+        if len(self._lightpath_values) < self._lp_cpt_count:
+            return
+        # The values dict never shrinks, so the gate can only pass from now
+        # on; route later callbacks straight to the steady-state path
+        self._lp_update_impl = self._lp_update_hot
+        self._lp_recompute(args, obj, kwargs)
 
-    @property
-    def removed(self):
-        return self._lightpath_ready and bool(self._removed)
+    def _lp_update_hot(self, args, obj, kwargs):
+        """Steady-state regime: cache the value and recompute directly."""
+        self._lightpath_values[obj] = kwargs
+        self._lp_recompute(args, obj, kwargs)
+
+    def _lp_recompute(self, args, obj, kwargs):
+        self._retry_lightpath = False
+        # Pass user function the full set of values
+        self._set_lightpath_states(self._lightpath_values)
+        self._lightpath_ready = not self._retry_lightpath
+        if self._lightpath_ready:
+            self.inserted = bool(self._inserted)
+            self.removed = bool(self._removed)
+            # Coalesce callback bursts: every cpt firing at once (e.g.
+            # at startup) lands here, but subscribers only care when
+            # the derived state actually changed
+            state = (getattr(self, '_inserted', None),
+                     getattr(self, '_removed', None),
+                     getattr(self, '_transmission', None))
+            if state != self._lp_last_state:
+                self._lp_last_state = state
+                # Tell lightpath to update
+                self._run_subs(sub_type=self.SUB_STATE)
+        else:
+            self.inserted = False
+            self.removed = False
+            if self._retry_lightpath and not self._destroyed:
+                # Use this when the device wasn't ready to set states
+                kw = dict(obj=obj)
+                kw.update(kwargs)
+                utils.schedule_task(self._update_lightpath,
+                                    args=args, kwargs=kw, delay=1.0)
 
     @property
     def transmission(self):
@@ -1900,6 +2347,12 @@ class LightpathInOutCptMixin(LightpathMixin):
 
     def __init__(self, *args, retry_delay=2.0, **kwargs):
         self.retry_delay = retry_delay
+        # Last (value, inserted, removed, transmission) per component, so a
+        # callback only re-runs the checks for components that moved
+        self._lp_contrib = {}
+        # The attribute name -> component mapping never changes after
+        # construction, so resolve each component once
+        self._lp_objs = {}
         super().__init__(*args, **kwargs)
 
     def _init_summary_signal(self):
@@ -1923,37 +2376,56 @@ class LightpathInOutCptMixin(LightpathMixin):
         return self._cached_state
 
     def calc_lightpath_state(self, **lightpath_kwargs):
-        in_check = []
-        out_check = []
-        trans_check = []
+        # Single pass with running aggregates: no intermediate lists, and
+        # the any/all/product step folds into the loop itself
+        inserted = False
+        removed = True
+        transmission = 1.0
+        # Local bindings for the per-component loop
+        lp_contrib = self._lp_contrib
+        lp_objs = self._lp_objs
         for sig_name, sig_value in lightpath_kwargs.items():
-            obj = getattr(self, sig_name)
-            if not obj._state_initialized:
-                # This would prevent make check_inserted, etc. fail
-                # if we cannot connect, supply an inconsistent state
-                # and queue up the calculation for later
-                self.log.debug('state not initialized, scheduling '
-                               'lightpath calculations for later')
-                if self._retry_lightpath:
-                    self._retry_lightpath = False
-                    utils.schedule_task(self._calc_cache_lightpath_state,
-                                        delay=self.retry_delay)
-
-                return LightpathState(
-                    inserted=True,
-                    removed=True,
-                    output={self.output_branches[0]: 1}
-                )
+            contrib = lp_contrib.get(sig_name)
+            if contrib is None or contrib[0] != sig_value:
+                # Every summary callback re-delivers all values; only re-run
+                # the checks for components whose value actually changed
+                obj = lp_objs.get(sig_name)
+                if obj is None:
+                    obj = getattr(self, sig_name)
+                    lp_objs[sig_name] = obj
+                if not obj._state_initialized:
+                    # This would prevent make check_inserted, etc. fail
+                    # if we cannot connect, supply an inconsistent state
+                    # and queue up the calculation for later
+                    self.log.debug('state not initialized, scheduling '
+                                   'lightpath calculations for later')
+                    if self._retry_lightpath:
+                        self._retry_lightpath = False
+                        utils.schedule_task(self._calc_cache_lightpath_state,
+                                            delay=self.retry_delay)
+
+                    return LightpathState(
+                        inserted=True,
+                        removed=True,
+                        output={self.output_branches[0]: 1}
+                    )
+
+                # get state of the InOutPositioner and check status
+                contrib = (sig_value,
+                           obj.check_inserted(sig_value),
+                           obj.check_removed(sig_value),
+                           obj.check_transmission(sig_value))
+                lp_contrib[sig_name] = contrib
 
             self._retry_lightpath = True
-
-            # get state of the InOutPositioner and check status
-            in_check.append(obj.check_inserted(sig_value))
-            out_check.append(obj.check_removed(sig_value))
-            trans_check.append(obj.check_transmission(sig_value))
-        self._inserted = any(in_check)
-        self._removed = all(out_check)
-        self._transmission = functools.reduce(lambda a, b: a*b, trans_check)
+            if contrib[1]:
+                inserted = True
+            if not contrib[2]:
+                removed = False
+            transmission *= contrib[3]
+        self._inserted = inserted
+        self._removed = removed
+        self._transmission = transmission
 
         return LightpathState(
             inserted=self._inserted,
@@ -226,6 +226,20 @@ def test_presets_desync(presets, fast_motor: FastMotor):
     assert not fast_motor2.presets.sync_needed()
 
 
+def test_presets_held_method_not_stale(presets, fast_motor: FastMotor):
+    logger.debug('test_presets_held_method_not_stale')
+    fast_motor.presets.add_hutch('sample', 3.0)
+
+    # Bound preset methods held across an edit must see the new value
+    held_mv = fast_motor.mv_sample
+    held_wm = fast_motor.wm_sample
+    fast_motor.presets.positions.sample.update_pos(7.0)
+
+    held_mv(wait=True)
+    assert fast_motor.wm() == 7.0
+    assert held_wm() == 0
+
+
 def test_presets_tab_init(fast_motor: FastMotor, deferred_fast_motor_presets):
     # deferred_fast_motor_preset must come last,
     # to clear cache after motor is created (and sync-ed at init)
@@ -234,8 +248,8 @@ def test_presets_tab_init(fast_motor: FastMotor, deferred_fast_motor_presets):
     assert not fast_motor.presets.sync_needed()
 
 
-@pytest.mark.parametrize("attr,", [
-    "wm_dne", "wm_in", "mv_dne", "mv_in", "umv_dne, umv_in"
+@pytest.mark.parametrize("attr", [
+    "wm_dne", "wm_in", "mv_dne", "mv_in", "umv_dne", "umv_in"
 ])
 def test_presets_getattribute_init(
     fast_motor: FastMotor, attr: str, deferred_fast_motor_presets